@@ -6,15 +6,31 @@ Generate documentation.
 import json
 import logging
 from datetime import datetime
+from functools import lru_cache
 from schema_models import ExceptionsSchema
 
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library when orjson is unavailable
+    orjson = None
+
+
+@lru_cache(maxsize=1)
+def _json_schema() -> dict:
+    """Build the JSON schema from Pydantic models once per process."""
+    return ExceptionsSchema.model_json_schema()
+
 
 def generate_simple_docs():
     """Generate simple, concise documentation."""
     logger = logging.getLogger(__name__)
     
     # Generate JSON schema from Pydantic models
-    json_schema = ExceptionsSchema.model_json_schema()
+    json_schema = _json_schema()
+    if orjson is not None:
+        json_schema_str = orjson.dumps(json_schema, option=orjson.OPT_INDENT_2).decode()
+    else:
+        json_schema_str = json.dumps(json_schema, indent=2)
     logger.debug("Generated JSON schema from Pydantic models")
     
     # Create simple Markdown documentation
@@ -51,6 +67,12 @@ python3 process_exceptions.py \\
   --schema-json-string '{{"version":"1.0.0","exceptions":[...]}}' \\
   --project-id "prj-rad-01-fanta-qwe" \\
   --output-file output/vars.json
+
+# Process many projects in one run (schema is validated once)
+python3 process_exceptions.py \\
+  --schema-file-path exceptions_schema.example.json \\
+  --project-ids-file project_ids.txt \\
+  --output-dir output/
 ```
 
 > **Note**: The script performs validation and generates `terraform.tfvars.json` but does NOT run terraform.
@@ -90,7 +112,7 @@ Exception IDs must be exactly 3 digits (e.g., "100", "042").
 <summary>JSON Schema</summary>
 
 ```json
-{json.dumps(json_schema, indent=2)}
+{json_schema_str}
 ```
 
 </details>
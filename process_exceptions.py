@@ -3,17 +3,41 @@ import re
 import argparse
 import logging
 from pathlib import Path
-from schema_models import ExceptionsSchema
+from schema_models import ExceptionsSchema, SERVICE_ACCOUNT_LIST_ADAPTER
 
-def process_exceptions(schema_data: dict, project_id: str, output_path: Path):
-    """
-    Processes the exceptions schema and generates a Terraform variables file
-    with two distinct lists for creating service accounts.
-    """
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library when orjson is unavailable
+    orjson = None
+
+# GCP project IDs: 6-30 characters, lowercase letters, digits and hyphens, starting with a letter
+PROJECT_ID_PATTERN = re.compile(r'^[a-z][a-z0-9-]{4,28}[a-z0-9]$')
+
+
+def json_loads(data):
+    """Deserialize JSON from str or bytes, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data) -> bytes:
+    """Serialize data to indented, newline-terminated JSON bytes, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, indent=2) + "\n").encode("utf-8")
+
+
+def dedup_key(data: dict) -> bytes:
+    """Build a hashable, key-order independent representation of a dict for deduplication."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(data, sort_keys=True).encode("utf-8")
+
+
+def load_schema(schema_data: dict) -> ExceptionsSchema:
+    """Validates the exceptions schema data and returns the parsed model."""
     logger = logging.getLogger(__name__)
-    logger.info(f"Processing exceptions for project ID: '{project_id}'")
-    
-    # Validate full schema structure first
     try:
         full_schema = ExceptionsSchema.model_validate(schema_data)
         logger.info(f"Full schema validation successful! Version: {full_schema.version}")
@@ -21,30 +45,40 @@ def process_exceptions(schema_data: dict, project_id: str, output_path: Path):
         logger.error(f"Schema validation failed: {e}")
         raise ValueError(f"Invalid schema: {e}")
     
-    # Use the validated schema
-    valid_exceptions = full_schema.exceptions
-    exception_ids = [exc.id for exc in valid_exceptions]
-    logger.info(f"Processing {len(valid_exceptions)} exceptions: {exception_ids}")
+    exception_ids = [exc.id for exc in full_schema.exceptions]
+    logger.info(f"Loaded {len(full_schema.exceptions)} exceptions: {exception_ids}")
+    return full_schema
+
+
+def process_project(full_schema: ExceptionsSchema, project_id: str, output_path: Path):
+    """
+    Matches a single project ID against an already loaded schema and writes
+    its Terraform variables file.
+    """
+    logger = logging.getLogger(__name__)
+    logger.info("Processing exceptions for project ID: '%s'", project_id)
 
     service_accounts = []
+    seen_service_accounts = set()
     matched_exceptions = []
     
-    for exception in valid_exceptions:
-        if re.match(exception.project_id_regex, project_id):
-            logger.info(f"Exception '{exception.id}' matches (regex: '{exception.project_id_regex}')")
+    for exception in full_schema.exceptions:
+        if exception.compiled_regex.match(project_id):
+            logger.info("Exception '%s' matches (regex: '%s')", exception.id, exception.project_id_regex)
             matched_exceptions.append(exception.id)
             
-            for sa in exception.spec.service_accounts:
-                sa_dict = sa.model_dump()
-                if sa_dict not in service_accounts:
+            for sa_dict in SERVICE_ACCOUNT_LIST_ADAPTER.dump_python(exception.spec.service_accounts):
+                sa_key = dedup_key(sa_dict)
+                if sa_key not in seen_service_accounts:
+                    seen_service_accounts.add(sa_key)
                     service_accounts.append(sa_dict)
         else:
-            logger.info(f"Exception '{exception.id}' does not match (regex: '{exception.project_id_regex}')")
+            logger.info("Exception '%s' does not match (regex: '%s')", exception.id, exception.project_id_regex)
     
     # Summary
     if matched_exceptions:
-        logger.info(f"Found {len(matched_exceptions)} matching exception(s): {matched_exceptions}")
-        logger.info(f"Total service accounts to create: {len(service_accounts)}")
+        logger.info("Found %d matching exception(s): %s", len(matched_exceptions), matched_exceptions)
+        logger.info("Total service accounts to create: %d", len(service_accounts))
     else:
         logger.info("No exceptions matched the project ID")
 
@@ -53,9 +87,42 @@ def process_exceptions(schema_data: dict, project_id: str, output_path: Path):
         "service_accounts": service_accounts
     }
 
-    with open(output_path, 'w') as f:
-        json.dump(terraform_vars, f, indent=4)
-    logger.info(f"Successfully generated Terraform variables at: {output_path}")
+    Path(output_path).write_bytes(json_dumps(terraform_vars))
+    logger.info("Successfully generated Terraform variables at: %s", output_path)
+
+
+def process_exceptions(schema_data: dict, project_id: str, output_path: Path):
+    """
+    Processes the exceptions schema and generates a Terraform variables file
+    with two distinct lists for creating service accounts.
+    """
+    full_schema = load_schema(schema_data)
+    process_project(full_schema, project_id, output_path)
+
+
+def process_exceptions_batch(schema_data: dict, project_ids: list, output_dir: Path):
+    """
+    Validates the schema once and writes one <project_id>.tfvars.json file
+    per project ID into output_dir.
+    """
+    # Project IDs become file names, so reject anything that is not a GCP project ID
+    invalid_ids = [project_id for project_id in project_ids if not PROJECT_ID_PATTERN.fullmatch(project_id)]
+    if invalid_ids:
+        raise ValueError(f"Invalid GCP project IDs: {invalid_ids}")
+    seen = set()
+    duplicates = set()
+    for project_id in project_ids:
+        if project_id in seen:
+            duplicates.add(project_id)
+        else:
+            seen.add(project_id)
+    if duplicates:
+        raise ValueError(f"Duplicate project IDs found: {duplicates}")
+    
+    full_schema = load_schema(schema_data)
+    for project_id in project_ids:
+        output_path = Path(output_dir) / f"{project_id}.tfvars.json"
+        process_project(full_schema, project_id, output_path)
 
 
 
@@ -80,23 +147,39 @@ if __name__ == "__main__":
     schema_group.add_argument("--schema-file-path", type=Path, help="Path to the exceptions JSON schema file.")
     schema_group.add_argument("--schema-json-string", type=str, help="Raw JSON string containing the exceptions schema.")
     
-    parser.add_argument("--project-id", type=str, required=True, help="The GCP project ID to evaluate.")
-    parser.add_argument("--output-file", type=Path, default="terraform/terraform.tfvars.json", help="Path for the output terraform.tfvars.json file.")
+    # Create mutually exclusive group for single or batch project input
+    project_group = parser.add_mutually_exclusive_group(required=True)
+    project_group.add_argument("--project-id", type=str, help="The GCP project ID to evaluate.")
+    project_group.add_argument("--project-ids-file", type=Path, help="Path to a newline-separated file of GCP project IDs to evaluate in one run.")
+    
+    parser.add_argument("--output-file", type=Path, help="Path for the output terraform.tfvars.json file (default: terraform/terraform.tfvars.json).")
+    parser.add_argument("--output-dir", type=Path, help="Directory for the <project_id>.tfvars.json files when using --project-ids-file (default: terraform).")
     
     args = parser.parse_args()
+    if args.project_ids_file and args.output_file is not None:
+        parser.error("--output-file cannot be used with --project-ids-file; use --output-dir")
+    if args.project_id and args.output_dir is not None:
+        parser.error("--output-dir cannot be used with --project-id; use --output-file")
 
     # Load schema data from either file or JSON string
     if args.schema_file_path:
         logger.info(f"Loading schema from file: {args.schema_file_path}")
-        with open(args.schema_file_path, 'r') as f:
-            schema_data = json.load(f)
+        schema_data = json_loads(args.schema_file_path.read_bytes())
     else:
         logger.info("Loading schema from JSON string")
         try:
-            schema_data = json.loads(args.schema_json_string)
+            schema_data = json_loads(args.schema_json_string)
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in --schema-json-string: {e}")
             exit(1)
 
-    args.output_file.parent.mkdir(parents=True, exist_ok=True)
-    process_exceptions(schema_data, args.project_id, args.output_file)
\ No newline at end of file
+    if args.project_ids_file:
+        project_ids = [line.strip() for line in args.project_ids_file.read_text().splitlines() if line.strip()]
+        logger.info(f"Loaded {len(project_ids)} project IDs from file: {args.project_ids_file}")
+        output_dir = args.output_dir or Path("terraform")
+        output_dir.mkdir(parents=True, exist_ok=True)
+        process_exceptions_batch(schema_data, project_ids, output_dir)
+    else:
+        output_file = args.output_file or Path("terraform/terraform.tfvars.json")
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        process_exceptions(schema_data, args.project_id, output_file)
\ No newline at end of file
@@ -6,15 +6,22 @@ Generate documentation.
 import json
 import logging
 from datetime import datetime
+from functools import lru_cache
 from schema_models import ExceptionsSchema
 
 
+@lru_cache(maxsize=1)
+def _json_schema() -> dict:
+    """Build the JSON schema from Pydantic models once per process."""
+    return ExceptionsSchema.model_json_schema()
+
+
 def generate_simple_docs():
     """Generate simple, concise documentation."""
     logger = logging.getLogger(__name__)
     
     # Generate JSON schema from Pydantic models
-    json_schema = ExceptionsSchema.model_json_schema()
+    json_schema = _json_schema()
     logger.debug("Generated JSON schema from Pydantic models")
     
     # Create simple Markdown documentation
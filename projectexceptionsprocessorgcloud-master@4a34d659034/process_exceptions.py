@@ -5,6 +5,10 @@ import logging
 from pathlib import Path
 from schema_models import ExceptionsSchema
 
+def dedup_key(data: dict) -> str:
+    """Build a hashable, key-order independent representation of a dict for deduplication."""
+    return json.dumps(data, sort_keys=True)
+
 def process_exceptions(schema_data: dict, project_id: str, output_path: Path):
     """Processes the exceptions schema and generates a Terraform variables file."""
     logger = logging.getLogger(__name__)
@@ -23,6 +27,8 @@ def process_exceptions(schema_data: dict, project_id: str, output_path: Path):
 
     service_accounts = []
     org_policy_overrides = []
+    seen_service_accounts = set()
+    seen_org_policy_overrides = set()
     matched_exceptions = []
     
     for exception in valid_exceptions:
@@ -33,12 +39,16 @@ def process_exceptions(schema_data: dict, project_id: str, output_path: Path):
             if exception.type == "create_service_accounts":
                 for sa in exception.spec.service_accounts:
                     sa_dict = sa.model_dump()
-                    if sa_dict not in service_accounts:
+                    sa_key = dedup_key(sa_dict)
+                    if sa_key not in seen_service_accounts:
+                        seen_service_accounts.add(sa_key)
                         service_accounts.append(sa_dict)
             elif exception.type == "override_org_policies":
                 for policy in exception.spec.org_policy_overrides:
                     policy_dict = policy.model_dump()
-                    if policy_dict not in org_policy_overrides:
+                    policy_key = dedup_key(policy_dict)
+                    if policy_key not in seen_org_policy_overrides:
+                        seen_org_policy_overrides.add(policy_key)
                         org_policy_overrides.append(policy_dict)
         else:
             logger.info(f"Exception '{exception.id}' does not match (regex: '{exception.project_id_regex}')")
@@ -2,11 +2,16 @@
 Pydantic models for exceptions schema validation and documentation generation.
 """
 
-from typing import List, Literal
-from pydantic import BaseModel, Field
+from typing import Any, List, Literal, Pattern
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter
 import re
 import logging
 
+try:
+    import re2
+except ImportError:  # google-re2 is optional; the stdlib re engine is used without it
+    re2 = None
+
 
 class ServiceAccount(BaseModel):
     """
@@ -50,6 +55,10 @@ class ServiceAccount(BaseModel):
     )
 
 
+# Reusable adapter so a whole list of service accounts is dumped in one serializer call
+SERVICE_ACCOUNT_LIST_ADAPTER = TypeAdapter(List[ServiceAccount])
+
+
 class ServiceAccountSpec(BaseModel):
     """
     Specification of what service accounts to create when an exception matches.
@@ -107,12 +116,36 @@ class Exception(BaseModel):
         description="Specification of what service accounts to create when this exception matches"
     )
     
+    _compiled_regex: Pattern[str] = PrivateAttr()
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Compile project_id_regex once so matching does not go through the re module cache."""
+        self.validate_regex()
+    
+    @property
+    def compiled_regex(self) -> Pattern[str]:
+        """Compiled project_id_regex pattern (RE2 when google-re2 is installed)."""
+        return self._compiled_regex
+    
     def validate_regex(self) -> 'Exception':
-        """Validate that project_id_regex is a valid regular expression."""
+        """
+        Validate that project_id_regex is a valid regular expression.
+        
+        When google-re2 is installed the pattern is compiled with RE2 where possible. RE2 differs
+        slightly from re: '$' does not match before a trailing newline, and '\\d'/'\\w' are
+        ASCII-only, so matching can depend on whether google-re2 is installed.
+        """
         try:
-            re.compile(self.project_id_regex)
+            self._compiled_regex = re.compile(self.project_id_regex)
         except re.error as e:
             raise ValueError(f"Invalid regex pattern '{self.project_id_regex}': {e}")
+        if re2 is not None:
+            # Prefer the linear-time RE2 engine; patterns using features it lacks
+            # (lookarounds, backreferences) keep the stdlib pattern
+            try:
+                self._compiled_regex = re2.compile(self.project_id_regex)
+            except re2.error:
+                pass
         return self
 
 
@@ -143,10 +176,15 @@ class ExceptionsSchema(BaseModel):
     
     def validate_unique_ids(self) -> 'ExceptionsSchema':
         """Validate that all exception IDs are unique."""
-        ids = [exc.id for exc in self.exceptions]
-        if len(ids) != len(set(ids)):
-            duplicates = [id for id in ids if ids.count(id) > 1]
-            raise ValueError(f"Duplicate exception IDs found: {set(duplicates)}")
+        seen = set()
+        duplicates = set()
+        for exc in self.exceptions:
+            if exc.id in seen:
+                duplicates.add(exc.id)
+            else:
+                seen.add(exc.id)
+        if duplicates:
+            raise ValueError(f"Duplicate exception IDs found: {duplicates}")
         return self
 
 
@@ -1,7 +1,6 @@
-import json
+import orjson
 import logging
 import base64
-import re
 from datetime import datetime, timedelta, timezone
 from google.cloud import secretmanager
 from google.cloud import iam_admin_v1
@@ -11,6 +10,33 @@ import functions_framework
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_UNIT_TO_DAYS = {
+    'd': 1.0,  # days
+    'h': 1.0 / 24.0,  # hours
+    'm': 1.0 / (24.0 * 60.0),  # minutes
+}
+
+# API clients are created lazily and reused across invocations on warm instances
+_secret_client = None
+_iam_client = None
+
+
+def get_secret_client():
+    """Return the shared Secret Manager client, creating it on first use."""
+    global _secret_client
+    if _secret_client is None:
+        _secret_client = secretmanager.SecretManagerServiceClient()
+    return _secret_client
+
+
+def get_iam_client():
+    """Return the shared IAM client, creating it on first use."""
+    global _iam_client
+    if _iam_client is None:
+        _iam_client = iam_admin_v1.IAMClient()
+    return _iam_client
+
+
 def parse_time_duration(duration_str):
     """
     Parse duration string like '1h', '2d', '30m', '1.5d' into days.
@@ -20,22 +46,15 @@ def parse_time_duration(duration_str):
     if not duration_str:
         raise ValueError("Duration string is empty")
     
-    # Parse with time units (required)
-    match = re.match(r'^(\d*\.?\d+)([dhm])$', duration_str.lower())
-    if not match:
+    # Parse with time units (required): digits with an optional single decimal point,
+    # at least one digit after it, followed by a unit suffix
+    normalized = duration_str.lower()
+    value, unit = normalized[:-1], normalized[-1]
+    days_per_unit = _UNIT_TO_DAYS.get(unit)
+    if days_per_unit is None or value.endswith('.') or not value.replace('.', '', 1).isdecimal():
         raise ValueError(f"Invalid duration format: {duration_str}. Must include time unit. Use formats like '1h', '2d', '30m'")
     
-    value, unit = match.groups()
-    value = float(value)
-    
-    if unit == 'd':  # days
-        return value
-    elif unit == 'h':  # hours
-        return value / 24.0
-    elif unit == 'm':  # minutes
-        return value / (24.0 * 60.0)
-    else:
-        raise ValueError(f"Unsupported time unit: {unit}")
+    return float(value) * days_per_unit
 
 
 @functions_framework.cloud_event
@@ -49,7 +68,8 @@ def handle_secret_expiration(cloud_event):
         logger.info("Secret renewal function triggered - only processing secrets with required ccoe_* labels: ccoe_service_account_name and ccoe_expiration_extension_time")
         # Parse the Cloud Event
         event_data = cloud_event.data
-        logger.info(f"Received event: {json.dumps(event_data, indent=2)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Received event: %s", orjson.dumps(event_data).decode())
         
         # Extract relevant information from the log entry
         json_payload = event_data.get('jsonPayload', {})
@@ -58,7 +78,7 @@ def handle_secret_expiration(cloud_event):
         # Check if this is an EXPIRES_IN_1_HOUR event
         event_type = json_payload.get('type')
         if event_type != 'EXPIRES_IN_1_HOUR':
-            logger.info(f"Ignoring event type: {event_type}")
+            logger.info("Ignoring event type: %s", event_type)
             return "OK"
         
         # Extract secret information
@@ -74,10 +94,10 @@ def handle_secret_expiration(cloud_event):
             logger.error("Missing required information from event")
             return "ERROR: Missing required information"
         
-        logger.info(f"Processing secret expiration for: {secret_id} in project: {project_id} (number: {project_number})")
+        logger.info("Processing secret expiration for: %s in project: %s (number: %s)", secret_id, project_id, project_number)
         
         # Get the secret to retrieve the service account name from labels
-        secret_client = secretmanager.SecretManagerServiceClient()
+        secret_client = get_secret_client()
         secret_resource = secret_client.get_secret(name=secret_name)
         
         ccoe_service_account_name = secret_resource.labels.get('ccoe_service_account_name')
@@ -85,26 +105,26 @@ def handle_secret_expiration(cloud_event):
         
         # Only process secrets that have both required ccoe_* labels
         if not ccoe_service_account_name or not ccoe_expiration_extension_time_str:
-            logger.info(f"Ignoring secret: has_ccoe_service_account_name={bool(ccoe_service_account_name)}, has_ccoe_expiration_extension_time={bool(ccoe_expiration_extension_time_str)} for secret: {secret_id}")
+            logger.info("Ignoring secret: has_ccoe_service_account_name=%s, has_ccoe_expiration_extension_time=%s for secret: %s", bool(ccoe_service_account_name), bool(ccoe_expiration_extension_time_str), secret_id)
             return "OK"
         
         # Parse expiration extension from label (required)
         try:
             expiration_extension_time = parse_time_duration(ccoe_expiration_extension_time_str)
         except ValueError as e:
-            logger.error(f"Invalid ccoe_expiration_extension_time value '{ccoe_expiration_extension_time_str}': {e}")
+            logger.error("Invalid ccoe_expiration_extension_time value '%s': %s", ccoe_expiration_extension_time_str, e)
             return "ERROR: Invalid ccoe_expiration_extension_time value"
         
-        logger.info(f"Using expiration extension: {ccoe_expiration_extension_time_str}")
+        logger.info("Using expiration extension: %s", ccoe_expiration_extension_time_str)
         
-        logger.info(f"Found service account name: {ccoe_service_account_name}")
+        logger.info("Found service account name: %s", ccoe_service_account_name)
         
         # Create a new service account key
-        iam_client = iam_admin_v1.IAMClient()
+        iam_client = get_iam_client()
         service_account_email = f"{ccoe_service_account_name}@{project_id}.iam.gserviceaccount.com"
         service_account_resource = f"projects/{project_id}/serviceAccounts/{service_account_email}"
         
-        logger.info(f"Creating new key for service account: {service_account_email}")
+        logger.info("Creating new key for service account: %s", service_account_email)
         
         # Create the key
         request = iam_admin_v1.CreateServiceAccountKeyRequest(
@@ -120,7 +140,7 @@ def handle_secret_expiration(cloud_event):
         logger.info("Successfully created new service account key")
         
         # Create a new version of the secret with the new key
-        logger.info(f"Adding new version to secret: {secret_id}")
+        logger.info("Adding new version to secret: %s", secret_id)
         
         response = secret_client.add_secret_version(
             request={
@@ -129,12 +149,12 @@ def handle_secret_expiration(cloud_event):
             }
         )
         
-        logger.info(f"Successfully created new secret version: {response.name}")
-        logger.info(f"Access new secret version with: gcloud secrets versions access latest --secret='{secret_id}' --project='{project_id}'")
+        logger.info("Successfully created new secret version: %s", response.name)
+        logger.info("Access new secret version with: gcloud secrets versions access latest --secret='%s' --project='%s'", secret_id, project_id)
         
         # Extend the secret's expiration from current expiration time
         current_expiration = secret_resource.expire_time
-        logger.info(f"Current secret expiration: {current_expiration}")
+        logger.info("Current secret expiration: %s", current_expiration)
         
         # Parse current expiration and extend by configured duration
         if current_expiration:
@@ -143,7 +163,7 @@ def handle_secret_expiration(cloud_event):
             new_expiration = current_exp_dt + timedelta(days=expiration_extension_time)
             new_expiration_str = new_expiration.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
             
-            logger.info(f"Extending secret expiration from {current_expiration} to: {new_expiration_str} (+{ccoe_expiration_extension_time_str})")
+            logger.info("Extending secret expiration from %s to: %s (+%s)", current_expiration, new_expiration_str, ccoe_expiration_extension_time_str)
         else:
             logger.error("No current expiration time found on secret")
             return "ERROR: No current expiration time found"
@@ -158,12 +178,12 @@ def handle_secret_expiration(cloud_event):
         )
         
         updated_secret = secret_client.update_secret(request=update_request)
-        logger.info(f"Successfully extended secret expiration from {current_expiration} to: {updated_secret.expire_time}")
+        logger.info("Successfully extended secret expiration from %s to: %s", current_expiration, updated_secret.expire_time)
         
         return "OK"
         
     except Exception as e:
-        logger.error(f"Error processing secret expiration: {str(e)}", exc_info=True)
+        logger.error("Error processing secret expiration: %s", e, exc_info=True)
         return f"ERROR: {str(e)}"
 
 